@@ -14,6 +14,7 @@ import warnings
 import importlib
 import functools
 import collections
+import weakref
 from contextlib import contextmanager
 
 __all__ = ['KwantDeprecationWarning', 'UserCodeError']
@@ -64,13 +65,30 @@ def deprecate_parameter(parameter_name, version=None, help=None,
             return
 
         sig = inspect.signature(f)
-
-        @functools.wraps(f)
-        def inner(*args, **kwargs):
-            # If the named argument is truthy
-            if sig.bind(*args, **kwargs).arguments.get(parameter_name):
-                warn()
-            return f(*args, **kwargs)
+        parameter = sig.parameters.get(parameter_name)
+
+        if (parameter is not None
+            and parameter.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD):
+            # Fast path: find the argument by position or by name, without
+            # binding the full signature on every call.
+            position = list(sig.parameters).index(parameter_name)
+
+            @functools.wraps(f)
+            def inner(*args, **kwargs):
+                # If the named argument is truthy
+                if len(args) > position:
+                    if args[position]:
+                        warn()
+                elif kwargs.get(parameter_name):
+                    warn()
+                return f(*args, **kwargs)
+        else:
+            @functools.wraps(f)
+            def inner(*args, **kwargs):
+                # If the named argument is truthy
+                if sig.bind(*args, **kwargs).arguments.get(parameter_name):
+                    warn()
+                return f(*args, **kwargs)
 
         return inner
 
@@ -202,6 +220,24 @@ def _hashable(obj):
     return isinstance(obj, collections.abc.Hashable)
 
 
+try:
+    cached_property = functools.cached_property
+except AttributeError:  # Python < 3.8
+    class cached_property:
+        """Minimal backport of 'functools.cached_property'."""
+
+        def __init__(self, func):
+            self.func = func
+            self.attrname = func.__name__
+            self.__doc__ = func.__doc__
+
+        def __get__(self, instance, owner=None):
+            if instance is None:
+                return self
+            value = instance.__dict__[self.attrname] = self.func(instance)
+            return value
+
+
 def memoize(f):
     """Decorator to memoize a function that works even with unhashable args.
 
@@ -220,3 +256,21 @@ def memoize(f):
         return result
     cache = {}
     return lookup
+
+
+# Maps objects to the dictionaries returned by 'object_cache'.
+_object_caches = weakref.WeakKeyDictionary()
+
+
+def object_cache(obj):
+    """Return a dictionary for caching values that are derived from 'obj'.
+
+    The dictionary lives as long as 'obj', but is stored outside of it, such
+    that it stays out of pickles and out of copies of ``obj.__dict__``.  If
+    'obj' is not hashable or cannot be weakly referenced, a new (empty)
+    dictionary is returned on every call, i.e. nothing is cached.
+    """
+    try:
+        return _object_caches.setdefault(obj, {})
+    except TypeError:
+        return {}
@@ -17,7 +17,7 @@ import bisect
 from .graph.core cimport CGraph, gintArraySlice
 from .graph.defs cimport gint
 from .graph.defs import gint_dtype
-from ._common import deprecate_args
+from ._common import deprecate_args, object_cache
 
 
 ### Non-vectorized methods
@@ -352,49 +352,83 @@ _shape_error_msg = (
 
 
 @cython.boundscheck(False)
-def _vectorized_make_sparse(subgraphs, hams, long [:] norbs, long [:] orb_offsets,
-                 long [:] site_offsets, shape=None):
-    ndata = sum(h.shape[0] * h.shape[1] * h.shape[2] for h in hams)
+def _vectorized_sparse_pattern(subgraphs, long [:] norbs,
+                               long [:] orb_offsets):
+    """Return the rows and columns of the matrix elements of 'subgraphs'.
+
+    The entries are in the order of the flattened matrix elements of the
+    terms, and only depend on the structure of the system.  The returned
+    arrays are read-only, so that they may be shared between matrices.
+    """
+    ndata = sum(len(ts_offs) * norbs[ta] * norbs[fa]
+                for (ta, fa), (ts_offs, _) in subgraphs)
 
     cdef long [:] rows_view, cols_view
-    cdef complex [:] data_view
 
     rows = np.empty((ndata,), dtype=long)
     cols = np.empty((ndata,), dtype=long)
-    data = np.empty((ndata,), dtype=complex)
     rows_view = rows
     cols_view = cols
-    data_view = data
 
-    cdef long i, j, k, m, N, M, P, to_off, from_off,\
-              ta, fa, to_norbs, from_norbs
+    cdef long i, j, k, m, N, M, P, to_off, from_off, ta, fa
     cdef const long [:] ts_offs, fs_offs
-    cdef complex [:, :, :] h
 
     m = 0
     # This outer loop zip() is pure Python, but that's ok, as it
     # has very few entries and the inner loops are fully vectorized
-    for ((ta, fa), (ts_offs, fs_offs)), h in zip(subgraphs, hams):
-        N = h.shape[0]
-        M = h.shape[1]
-        P = h.shape[2]
-
-        if norbs[ta] != M or norbs[fa] != P:
-            to_sites = site_offsets[ta] + np.array(ts_offs)
-            from_sites = site_offsets[fa] + np.array(fs_offs)
-            hops = np.array([to_sites, from_sites]).transpose()
-            raise ValueError(_shape_error_msg.format(hops))
-
+    for (ta, fa), (ts_offs, fs_offs) in subgraphs:
+        N = ts_offs.shape[0]
+        M = norbs[ta]
+        P = norbs[fa]
         for i in range(N):
-            to_off = orb_offsets[ta] + norbs[ta] * ts_offs[i]
-            from_off = orb_offsets[fa] + norbs[fa] * fs_offs[i]
+            to_off = orb_offsets[ta] + M * ts_offs[i]
+            from_off = orb_offsets[fa] + P * fs_offs[i]
             for j in range(M):
                 for k in range(P):
                     rows_view[m] = to_off + j
                     cols_view[m] = from_off + k
-                    data_view[m] = h[i, j, k]
                     m += 1
 
+    rows.flags.writeable = False
+    cols.flags.writeable = False
+    return rows, cols
+
+
+def _cached_sparse_pattern(self, name, subgraphs, long [:] norbs,
+                           long [:] orb_offsets):
+    # Systems are immutable, so the pattern of each kind of matrix
+    # ('name') only needs to be computed once.  This is only used for the
+    # cell matrices of infinite systems, which are requested for every
+    # energy.  The pattern of a whole finite system would take as much
+    # memory as its Hamiltonian for as long as the system lives.
+    patterns = object_cache(self).setdefault('sparse patterns', {})
+    try:
+        return patterns[name]
+    except KeyError:
+        pattern = _vectorized_sparse_pattern(subgraphs, norbs, orb_offsets)
+        patterns[name] = pattern
+        return pattern
+
+
+def _vectorized_make_sparse(subgraphs, hams, long [:] norbs,
+                            long [:] orb_offsets, long [:] site_offsets,
+                            shape=None, pattern=None):
+    for ((ta, fa), (ts_offs, fs_offs)), h in zip(subgraphs, hams):
+        if norbs[ta] != h.shape[1] or norbs[fa] != h.shape[2]:
+            to_sites = site_offsets[ta] + np.array(ts_offs)
+            from_sites = site_offsets[fa] + np.array(fs_offs)
+            hops = np.array([to_sites, from_sites]).transpose()
+            raise ValueError(_shape_error_msg.format(hops))
+
+    if pattern is None:
+        pattern = _vectorized_sparse_pattern(subgraphs, norbs, orb_offsets)
+    rows, cols = pattern
+    # The pattern lists the matrix elements of each term in C order.
+    if hams:
+        data = np.concatenate([np.ravel(h) for h in hams])
+    else:
+        data = np.empty((0,), dtype=complex)
+
     if shape is None:
         shape = (orb_offsets[-1], orb_offsets[-1])
 
@@ -413,7 +447,7 @@ def _vectorized_make_dense(subgraphs, hams, long [:] norbs, long [:] orb_offsets
     cdef long i, j, k, N, M, P, to_off, from_off,\
               ta, fa, to_norbs, from_norbs
     cdef const long [:] ts_offs, fs_offs
-    cdef complex [:, :, :] h
+    cdef const complex [:, :, :] h
 
     # This outer loop zip() is pure Python, but that's ok, as it
     # has very few entries and the inner loops are fully vectorized
@@ -510,8 +544,12 @@ def vectorized_hamiltonian_submatrix(self, args=(), sparse=False,
 
     _, norbs, orb_offsets = self.site_ranges.transpose()
 
-    func = _vectorized_make_sparse if sparse else _vectorized_make_dense
-    mat = func(subgraphs, hams, norbs, orb_offsets, site_offsets)
+    if sparse:
+        mat = _vectorized_make_sparse(subgraphs, hams, norbs, orb_offsets,
+                                      site_offsets)
+    else:
+        mat = _vectorized_make_dense(subgraphs, hams, norbs, orb_offsets,
+                                     site_offsets)
 
     if return_norb:
         return (mat, _expand_norbs(norbs, site_offsets))
@@ -524,9 +562,14 @@ def vectorized_hamiltonian_submatrix(self, args=(), sparse=False,
 def vectorized_cell_hamiltonian(self, args=(), sparse=False, *, params=None):
     """Hamiltonian of a single cell of the infinite system.
 
+    If 'sparse' is None, a sparse matrix is returned for large and
+    sparsely connected cells, and a dense array otherwise.
+
     Providing positional arguments via 'args' is deprecated,
     instead, provide named parameters as a dictionary via 'params'.
     """
+    if sparse is None:
+        sparse = self._prefer_sparse_cell()
 
     site_offsets = np.cumsum([0] + [len(arr) for arr in self.site_arrays])
     # Site array where next cell starts
@@ -565,8 +608,14 @@ def vectorized_cell_hamiltonian(self, args=(), sparse=False, *, params=None):
     _, norbs, orb_offsets = self.site_ranges.transpose()
 
     shape = (orb_offsets[next_cell], orb_offsets[next_cell])
-    func = _vectorized_make_sparse if sparse else _vectorized_make_dense
-    mat = func(subgraphs, hams, norbs, orb_offsets, site_offsets, shape=shape)
+    if sparse:
+        pattern = _cached_sparse_pattern(self, 'cell', subgraphs,
+                                         norbs, orb_offsets)
+        mat = _vectorized_make_sparse(subgraphs, hams, norbs, orb_offsets,
+                                      site_offsets, shape, pattern)
+    else:
+        mat = _vectorized_make_dense(subgraphs, hams, norbs, orb_offsets,
+                                     site_offsets, shape)
 
     return mat
 
@@ -583,9 +632,14 @@ def vectorized_inter_cell_hopping(self, args=(), sparse=False, *, params=None):
     in the unit cell, and ``N_iface`` is the number of orbitals on the
     *interface* sites (i.e. the sites with hoppings *to* the next unit cell).
 
+    If 'sparse' is None, a sparse matrix is returned for large and
+    sparsely connected cells, and a dense array otherwise.
+
     Providing positional arguments via 'args' is deprecated,
     instead, provide named parameters as a dictionary via 'params'.
     """
+    if sparse is None:
+        sparse = self._prefer_sparse_cell()
 
     site_offsets = np.cumsum([0] + [len(arr) for arr in self.site_arrays])
 
@@ -644,6 +698,12 @@ def vectorized_inter_cell_hopping(self, args=(), sparse=False, *, params=None):
     # TODO: return a square matrix when we no longer need to maintain
     #       backwards compatibility with unvectorized systems.
     shape = (fd_norbs, iface_norbs)
-    func = _vectorized_make_sparse if sparse else _vectorized_make_dense
-    mat = func(subgraphs, hams, norbs, orb_offsets, site_offsets, shape=shape)
+    if sparse:
+        pattern = _cached_sparse_pattern(self, 'inter cell', subgraphs,
+                                         norbs, orb_offsets)
+        mat = _vectorized_make_sparse(subgraphs, hams, norbs, orb_offsets,
+                                      site_offsets, shape, pattern)
+    else:
+        mat = _vectorized_make_dense(subgraphs, hams, norbs, orb_offsets,
+                                     site_offsets, shape)
     return mat
@@ -26,7 +26,7 @@ from .linalg import lll
 from .operator import Density
 from .physics import DiscreteSymmetry, magnetic_gauge
 from ._common import (ensure_isinstance, get_parameters, reraise_warnings,
-                      interleave, deprecate_args, memoize)
+                      interleave, deprecate_args, memoize, object_cache)
 
 
 __all__ = ['Builder', 'HoppingKind', 'Lead',
@@ -144,7 +144,7 @@ class HoppingKind(tuple):
         for a in H:
             if a.family != family_a:
                 continue
-            b = Site(family_b, a.tag - delta, True)
+            b = Site._make(family_b, a.tag - delta)
             if symtofd(b) in H:
                 yield a, b
 
@@ -1926,6 +1926,33 @@ class _VectorizedFinalizedBuilderMixin(_FinalizedBuilderMixin):
                 h = h.conjugate().transpose()
             return h
 
+    def _get_term_data(self):
+        # Everything that 'hamiltonian_term' needs to know about each term,
+        # independent of the 'selector' and the parameters.  The symmetry
+        # group element of a term is only applied if it is not the identity.
+        cache = object_cache(self)
+        try:
+            return cache['term data']
+        except KeyError:
+            pass
+        term_data = []
+        for term, val, error in zip(self.terms, self._term_values,
+                                    self._term_errors):
+            (to_which, from_which), (to_off, from_off) = \
+                self.subgraphs[term.subgraph]
+            to_array = self.site_arrays[to_which]
+            from_array = self.site_arrays[from_which]
+            is_onsite = to_off is from_off
+            symmetry_element = (term.symmetry_element
+                                if any(term.symmetry_element) else None)
+            term_data.append((
+                val, error, term.parameters, is_onsite, symmetry_element,
+                to_array.family, to_array.tags, to_off,
+                from_array.family, from_array.tags, from_off,
+            ))
+        cache['term data'] = term_data
+        return term_data
+
     def hamiltonian_term(self, index, selector=slice(None),
                          args=(), params=None):
         if args and params:
@@ -1933,31 +1960,26 @@ class _VectorizedFinalizedBuilderMixin(_FinalizedBuilderMixin):
         if index < 0:
             raise ValueError("term indices must be non-negative")
 
-        term = self.terms[index]
-        val = self._term_values[index]
+        (val, error, parameters, is_onsite, symmetry_element,
+         to_family, to_tags, to_off,
+         from_family, from_tags, from_off) = self._get_term_data()[index]
 
         if not callable(val):
             return val[selector]
 
         # Construct site arrays to pass to the vectorized value function.
-        subgraph = self.subgraphs[self.terms[index].subgraph]
-        (to_which, from_which), (to_off, from_off) = subgraph
-        is_onsite = to_off is from_off
         to_off = to_off[selector]
-        from_off = from_off[selector]
-        assert len(to_off) == len(from_off)
-
-        to_family = self.site_arrays[to_which].family
-        to_tags = self.site_arrays[to_which].tags
-        to_site_array = SiteArray(to_family, to_tags[to_off])
+        to_site_array = SiteArray.from_validated(to_family,
+                                                 to_tags[to_off])
         site_arrays = (to_site_array,)
         if not is_onsite:
-            from_family = self.site_arrays[from_which].family
-            from_tags = self.site_arrays[from_which].tags
-            from_site_array = self.symmetry.act(
-                term.symmetry_element,
-                SiteArray(from_family, from_tags[from_off])
-            )
+            from_off = from_off[selector]
+            assert len(to_off) == len(from_off)
+            from_site_array = SiteArray.from_validated(from_family,
+                                                       from_tags[from_off])
+            if symmetry_element is not None:
+                from_site_array = self.symmetry.act(symmetry_element,
+                                                    from_site_array)
             site_arrays = (to_site_array, from_site_array)
 
         # Construct args from params
@@ -1965,12 +1987,12 @@ class _VectorizedFinalizedBuilderMixin(_FinalizedBuilderMixin):
             # There was a problem extracting parameter names from the value
             # function (probably an illegal signature) and we are using
             # keyword parameters.
-            if self._term_errors[index] is not None:
-                raise self._term_errors[index]
+            if error is not None:
+                raise error
             try:
-                args = [params[p] for p in term.parameters]
+                args = [params[p] for p in parameters]
             except KeyError:
-                missing = [p for p in term.parameters if p not in params]
+                missing = [p for p in parameters if p not in params]
                 msg = ('System is missing required arguments: ',
                        ', '.join(map('"{}"'.format, missing)))
                 raise TypeError(''.join(msg))
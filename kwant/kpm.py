@@ -7,9 +7,7 @@
 # the file AUTHORS.rst at the top-level directory of this distribution and at
 # https://kwant-project.org/authors.
 import math
-from operator import add
 from collections.abc import Iterable
-from functools import reduce
 import numpy as np
 from numpy.polynomial.chebyshev import chebval
 from scipy.sparse import coo_matrix, csr_matrix
@@ -19,9 +17,7 @@ import scipy.fftpack as fft
 
 from . import system
 from ._common import ensure_rng
-from .operator import (_LocalOperator, _get_tot_norbs, _get_all_orbs,
-                       _normalize_site_where)
-from .graph.defs import gint_dtype
+from .operator import _LocalOperator, _get_tot_norbs, _normalize_site_where
 
 __all__ = ['SpectralDensity', 'Correlator', 'conductivity',
            'RandomVectors', 'LocalVectors', 'jackson_kernel', 'lorentz_kernel',
@@ -1007,13 +1003,10 @@ def _from_where_to_orbs(syst, where):
     """Returns a list of slices of the orbitals in 'where'"""
     assert isinstance(syst, system.System)
     where = _normalize_site_where(syst, where)
-    _site_ranges = np.asarray(syst.site_ranges, dtype=gint_dtype)
-    offsets, norbs = _get_all_orbs(where, _site_ranges)
+    offsets = syst.orbital_offsets
     # concatenate all the orbitals
-    orbs = [list(range(start, start+orbs))
-            for start, orbs in zip(offsets[:, 0], norbs[:, 0])]
-    orbs = reduce(add, orbs)
-    return orbs
+    return [orb for site in where[:, 0]
+            for orb in range(offsets[site], offsets[site + 1])]
 
 
 def _normalize_orbs_where(syst, where):
@@ -179,7 +179,7 @@ class Polyatomic:
                 symmetry = symmetry.symmetry
 
             def fd_site(lat, tag):
-                return symmetry.to_fd(Site(lat, tag, True))
+                return symmetry.to_fd(Site._make(lat, tag))
 
             dim = len(start)
             if dim != self._prim_vecs.shape[1]:
@@ -470,9 +470,10 @@ class Monatomic(system.SiteFamily, Polyatomic):
     def __str__(self):
         return self.cached_str
 
+    tag_dtype = int
+
     def normalize_tags(self, tags):
-        tags = np.asarray(tags, int)
-        tags.flags.writeable = False
+        tags = super().normalize_tags(tags)
         if tags.shape[1] != self.lattice_dim:
             raise ValueError("Dimensionality mismatch.")
         return tags
@@ -701,7 +702,10 @@ class TranslationalSymmetry(system.Symmetry):
         if isinstance(site, system.Site):
             result = ta.dot(det_x_inv_m_part, site.tag) // det_m
         elif isinstance(site, system.SiteArray):
-            result = np.dot(det_x_inv_m_part, site.tags.transpose()) // det_m
+            # 'matmul' is considerably faster than 'dot' for integer arrays.
+            result = np.matmul(det_x_inv_m_part, site.tags.transpose())
+            if det_m != 1:
+                result //= det_m
         else:
             raise TypeError("'site' must be a Site or a SiteArray")
 
@@ -709,9 +713,13 @@ class TranslationalSymmetry(system.Symmetry):
 
     def act(self, element, a, b=None):
         is_site = isinstance(a, system.Site)
+        # Shifting tags by lattice vectors keeps them normalized.
+        make_site_array = system.SiteArray.from_validated
         # Tinyarray for small arrays (single site) else numpy
-        array_mod = ta if is_site else np
-        element = array_mod.array(element)
+        if is_site:
+            element, dot = ta.array(element), ta.dot
+        else:
+            element, dot = np.asarray(element), np.matmul
         if not np.issubdtype(element.dtype, np.integer):
             raise ValueError("group element must be a tuple of integers")
         if (len(element.shape) == 2 and is_site):
@@ -723,7 +731,7 @@ class TranslationalSymmetry(system.Symmetry):
             element = element.reshape(-1, 1)
         m_part = self._get_site_family_data(a.family)[0]
         try:
-            delta = array_mod.dot(m_part, element)
+            delta = dot(m_part, element)
         except ValueError:
             msg = 'Expecting a {0}-tuple group element, but got `{1}` instead.'
             raise ValueError(msg.format(self.num_directions, element))
@@ -731,20 +739,20 @@ class TranslationalSymmetry(system.Symmetry):
             delta = -delta
         if b is None:
             if is_site:
-                return system.Site(a.family, a.tag + delta, True)
+                return system.Site._make(a.family, a.tag + delta)
             else:
-                return system.SiteArray(a.family, a.tags + delta.transpose())
+                return make_site_array(a.family, a.tags + delta.transpose())
         elif b.family == a.family:
             if is_site:
-                return (system.Site(a.family, a.tag + delta, True),
-                        system.Site(b.family, b.tag + delta, True))
+                return (system.Site._make(a.family, a.tag + delta),
+                        system.Site._make(b.family, b.tag + delta))
             else:
-                return (system.SiteArray(a.family, a.tags + delta.transpose()),
-                        system.SiteArray(b.family, b.tags + delta.transpose()))
+                return (make_site_array(a.family, a.tags + delta.transpose()),
+                        make_site_array(b.family, b.tags + delta.transpose()))
         else:
             m_part = self._get_site_family_data(b.family)[0]
             try:
-                delta2 = ta.dot(m_part, element)
+                delta2 = dot(m_part, element)
             except ValueError:
                 msg = ('Expecting a {0}-tuple group element, '
                        'but got `{1}` instead.')
@@ -752,11 +760,11 @@ class TranslationalSymmetry(system.Symmetry):
             if self.is_reversed:
                 delta2 = -delta2
             if is_site:
-                return (system.Site(a.family, a.tag + delta, True),
-                        system.Site(b.family, b.tag + delta2, True))
+                return (system.Site._make(a.family, a.tag + delta),
+                        system.Site._make(b.family, b.tag + delta2))
             else:
-                return (system.SiteArray(a.family, a.tags + delta.transpose()),
-                        system.SiteArray(b.family, b.tags + delta2.transpose()))
+                return (make_site_array(a.family, a.tags + delta.transpose()),
+                        make_site_array(b.family, b.tags + delta2.transpose()))
 
     def reversed(self):
         """Return a reversed copy of the symmetry.
@@ -9,7 +9,7 @@ cdef int _is_hermitian(
 ) except -1
 
 cdef int _is_hermitian_3d(
-    complex[:, :, :] a, double atol=*, double rtol=*
+    const complex[:, :, :] a, double atol=*, double rtol=*
 ) except -1
 
 cdef _select(gint[:, :] arr, gint[:] indexes)
@@ -17,11 +17,11 @@ cdef _select(gint[:, :] arr, gint[:] indexes)
 cdef int _check_onsite(complex[:, :] M, gint norbs,
                        int check_hermiticity) except -1
 
-cdef int _check_onsites(complex[:, :, :] M, gint norbs,
+cdef int _check_onsites(const complex[:, :, :] M, gint norbs,
                         int check_hermiticity) except -1
 
-cdef int _check_hams(complex[:, :, :] H, gint to_norbs, gint from_norbs,
-                     int check_hermiticity) except -1
+cdef int _check_hams(const complex[:, :, :] H, gint to_norbs,
+                     gint from_norbs, int check_hermiticity) except -1
 
 cdef void _get_orbs(gint[:, :] site_ranges, gint site,
                     gint *start_orb, gint *norbs)
@@ -83,7 +83,7 @@ cdef int _is_hermitian(
 @cython.boundscheck(False)
 @cython.wraparound(False)
 cdef int _is_hermitian_3d(
-    complex[:, :, :] a, double atol=1e-300, double rtol=1e-13
+    const complex[:, :, :] a, double atol=1e-300, double rtol=1e-13
 ) except -1:
     "Return True if 'a' is Hermitian"
 
@@ -144,8 +144,8 @@ cdef int _check_onsite(complex[:, :] M, gint norbs,
     return 0
 
 
-cdef int _check_onsites(complex[:, :, :] M, gint norbs,
-                       int check_hermiticity) except -1:
+cdef int _check_onsites(const complex[:, :, :] M, gint norbs,
+                        int check_hermiticity) except -1:
     "Check onsite matrix for correct shape and hermiticity."
     if M.shape[1] != M.shape[2]:
         raise UserCodeError('Onsite matrix is not square')
@@ -156,8 +156,8 @@ cdef int _check_onsites(complex[:, :, :] M, gint norbs,
     return 0
 
 
-cdef int _check_hams(complex[:, :, :] H, gint to_norbs, gint from_norbs,
-                     int check_hermiticity) except -1:
+cdef int _check_hams(const complex[:, :, :] H, gint to_norbs,
+                     gint from_norbs, int check_hermiticity) except -1:
     if H.shape[1] != to_norbs or H.shape[2] != from_norbs:
         raise UserCodeError(_shape_msg.format('Hamiltonian'))
     if check_hermiticity and not _is_hermitian_3d(H):
@@ -358,7 +358,7 @@ class _VectorizedFunctionalOnsite:
     def __call__(self, site_range, site_offsets, *args):
         site_array = self.site_arrays[site_range]
         tags = site_array.tags[site_offsets]
-        sites = SiteArray(site_array.family, tags)
+        sites = SiteArray.from_validated(site_array.family, tags)
         try:
             ret = self.onsite(sites, *args)
         except Exception as exc:
@@ -607,7 +607,7 @@ cdef class BlockSparseMatrix:
             data_size += block_shapes[w, 0] * block_shapes[w, 1]
         ### Populate data array
         self.data = np.empty((data_size,), dtype=complex)
-        cdef complex[:, :, :] data
+        cdef const complex[:, :, :] data
         cdef gint[:] where_indexes
         cdef gint i, j, k, off, a, b, a_norbs, b_norbs
         for where_indexes, data in matrix_elements:
@@ -18,7 +18,7 @@ import scipy.linalg as la
 from .. import linalg as kla
 from scipy.linalg import block_diag
 from scipy.sparse import (identity as sp_identity, hstack as sp_hstack,
-                          csr_matrix)
+                          csr_matrix, issparse)
 
 
 __all__ = ['selfenergy', 'modes', 'PropagatingModes', 'StabilizedModes']
@@ -978,9 +978,9 @@ def modes(h_cell, h_hop, tol=1e6, stabilization=None, *,
 
     Parameters
     ----------
-    h_cell : numpy array, real or complex, shape (N,N) The unit cell
-        Hamiltonian of the lead unit cell.
-    h_hop : numpy array, real or complex, shape (N,M)
+    h_cell : numpy array or sparse matrix, real or complex, shape (N,N)
+        The unit cell Hamiltonian of the lead unit cell.
+    h_hop : numpy array or sparse matrix, real or complex, shape (N,M)
         The hopping matrix from a lead cell to the one on which self-energy
         has to be calculated (and any other hopping in the same direction).
     tol : float
@@ -1035,6 +1035,10 @@ def modes(h_cell, h_hop, tol=1e6, stabilization=None, *,
     basis in which the scattering modes are expressed - see
     `~kwant.physics.DiscreteSymmetry` for details.
 
+    If `h_cell` and `h_hop` are sparse, only the blocks selected by the
+    `projectors` are converted to dense matrices, which saves memory for
+    leads with a conservation law.
+
     This function uses the most stable and efficient algorithm for calculating
     the mode decomposition that the Kwant authors are aware about. Its details
     are to be published.
@@ -1046,7 +1050,11 @@ def modes(h_cell, h_hop, tol=1e6, stabilization=None, *,
     if h_cell.shape != (n, n):
         raise ValueError("Incompatible matrix sizes for h_cell and h_hop.")
 
-    if not np.any(h_hop):
+    sparse = issparse(h_cell) or issparse(h_hop)
+    if sparse:
+        h_cell, h_hop = csr_matrix(h_cell), csr_matrix(h_hop)
+
+    if not (h_hop.count_nonzero() if sparse else np.any(h_hop)):
         wf = np.zeros((n, 0))
         v = np.zeros((m, 0))
         m = np.zeros((0, 0))
@@ -1056,9 +1064,12 @@ def modes(h_cell, h_hop, tol=1e6, stabilization=None, *,
     ham = h_cell
     # Avoid the trouble of dealing with non-square hopping matrices.
     # TODO: How to avoid this while not doing a lot of book-keeping?
-    hop = np.empty_like(ham, dtype=h_hop.dtype)
-    hop[:, :m] = h_hop
-    hop[:, m:] = 0
+    if sparse:
+        hop = sp_hstack([h_hop, csr_matrix((n, n - m))], format='csr')
+    else:
+        hop = np.empty_like(ham, dtype=h_hop.dtype)
+        hop[:, :m] = h_hop
+        hop[:, m:] = 0
 
     # Provide default values to not deal with special cases.
     if projectors is None:
@@ -1084,9 +1095,15 @@ def modes(h_cell, h_hop, tol=1e6, stabilization=None, *,
         b = projection_op
         return b.T.conj() @ a @ (b.conj() if antiunitary else b)
 
+    def block(matrix, x, y):
+        sub = matrix[x, y]
+        return sub.toarray() if sparse else sub
+
     # Conservation law basis
     ham_cons = basis_change(ham)
     hop_cons = basis_change(hop)
+    if sparse:
+        ham_cons, hop_cons = ham_cons.tocsr(), hop_cons.tocsr()
     trs = basis_change(time_reversal, True)
     phs = basis_change(particle_hole, True)
     sls = basis_change(chiral)
@@ -1095,8 +1112,8 @@ def modes(h_cell, h_hop, tol=1e6, stabilization=None, *,
     block_modes = len(projectors) * [None]
     numbers_coords = combinations_with_replacement(enumerate(indices), 2)
     for (i, x), (j, y) in numbers_coords:
-        h = ham_cons[x, y]
-        t = hop_cons[x, y]
+        h = block(ham_cons, x, y)
+        t = block(hop_cons, x, y)
         # Symmetries that project from block x to block y
         symmetries = [symm[y, x] for symm in (trs, phs, sls)]
         symmetries = [(symm if nonzero_symm_projection(symm) else None) for
@@ -1111,12 +1128,10 @@ def modes(h_cell, h_hop, tol=1e6, stabilization=None, *,
             if block_modes[j] is not None:
                 # Modes in the block already computed.
                 continue
-            x, y = tuple(np.mgrid[x, x]), tuple(np.mgrid[y, y])
-
-            if ham_cons[x].shape != ham_cons[y].shape:
+            if h.shape[0] != h.shape[1]:
                 continue
-            if (np.allclose(ham_cons[x], ham_cons[y]) and
-                np.allclose(hop_cons[x], hop_cons[y])):
+            if (np.allclose(block(ham_cons, x, x), block(ham_cons, y, y)) and
+                np.allclose(block(hop_cons, x, x), block(hop_cons, y, y))):
                 unitary = sp_identity(h.shape[0])
             else:
                 unitary = None
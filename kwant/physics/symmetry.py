@@ -32,6 +32,27 @@ def cond_conj(op, conj):
     return op.conj() if conj else op
 
 
+def _square(matrix):
+    """Pad 'matrix' by zeros to be square, and convert it to CSR if sparse."""
+    n, m = matrix.shape
+    if isinstance(matrix, np.ndarray):
+        if n != m:
+            new_matrix = np.empty((n, n), dtype=matrix.dtype)
+            new_matrix[:, :m] = matrix
+            new_matrix[:, m:] = 0
+            matrix = new_matrix
+        return matrix
+    elif n != m:
+        return hstack([matrix, csr_matrix((n, n-m))], format='csr')
+    else:
+        # Convert once, rather than in every product.
+        return matrix.tocsr()
+
+
+def _is_nonzero(commutator):
+    return np.linalg.norm(commutator.data) > 1e-8
+
+
 _conj = [True, True, False]
 _names = ['Time reversal', 'Particle-hole', 'Chiral']
 _signs = [1, -1, -1]
@@ -168,6 +189,10 @@ class DiscreteSymmetry:
         self.projectors = projectors
         self.time_reversal, self.particle_hole, self.chiral = symms
 
+    def is_trivial(self):
+        """Return whether no symmetry or conservation law is declared."""
+        return all(symmetry is None for symmetry in self[:])
+
     def validate(self, matrix):
         """Check if a matrix satisfies the discrete symmetries.
 
@@ -184,31 +209,49 @@ class DiscreteSymmetry:
             "Particle-hole", "Chiral". If no symmetries are broken, returns
             an empty list.
         """
-        # Extra transposes are to enforse sparse dot product in case matrix is
-        # dense.
-        n, m = matrix.shape
-        if n != m:
-            if isinstance(matrix, np.ndarray):
-                new_matrix = np.empty((n, n), dtype=matrix.dtype)
-                new_matrix[:, :m] = matrix
-                new_matrix[:, m:] = 0
-                matrix = new_matrix
-            else:
-                matrix = hstack([matrix, csr_matrix((n, n-m))])
+        return self._validate([matrix])
+
+    def validate_pair(self, ham, hop):
+        """Check if two matrices satisfy the discrete symmetries.
+
+        This is equivalent to combining ``validate(ham)`` and
+        ``validate(hop)``, but each symmetry operator is only prepared once.
+
+        Parameters
+        ----------
+        ham, hop : sparse or dense matrices
+            Typically the cell Hamiltonian and the inter-cell hopping of a
+            lead.  Rectangular matrices are padded by zeros to be square.
+
+        Returns
+        -------
+        broken_symmetries : list
+            List of strings, the names of symmetries broken by either
+            matrix, in the same format as for `validate`.
+        """
+        return self._validate([ham, hop])
+
+    def _validate(self, matrices):
+        if self.is_trivial():
+            return []
+        matrices = [_square(matrix) for matrix in matrices]
+        # The symmetry operators are sparse, so all the products below are
+        # sparse if a matrix is sparse, and dense otherwise.
         broken_symmetries = []
         if self.projectors is not None:
             for proj in self.projectors:
-                full = proj.dot(proj.T.conj())
-                commutator = full.dot(matrix) - (full.T.dot(matrix.T)).T
-                if np.linalg.norm(commutator.data) > 1e-8:
+                full = proj @ proj.T.conj()
+                if any(_is_nonzero(full @ matrix - matrix @ full)
+                       for matrix in matrices):
                     broken_symmetries.append('Conservation law')
                     break
         for symm, conj, sign, name in zip(self[1:], _conj, _signs, _names):
             if symm is None:
                 continue
-            commutator = symm.T.conj().dot((symm.T.dot(matrix.T)).T)
-            commutator = commutator - sign * cond_conj(matrix, conj)
-            if np.linalg.norm(commutator.data) > 1e-8:
+            symm_hc = symm.T.conj().tocsr()
+            if any(_is_nonzero(symm_hc @ (matrix @ symm)
+                               - sign * cond_conj(matrix, conj))
+                   for matrix in matrices):
                 broken_symmetries.append(name)
         return broken_symmetries
 
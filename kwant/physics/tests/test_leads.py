@@ -782,6 +782,12 @@ def test_cons_rectangular_hopping():
     modes2 = kwant.physics.leads.modes(H_cell, H_hop, projectors=projectors)
     current_conserving(modes2[1])
     assert_almost_equal(modes1[1].selfenergy(), modes2[1].selfenergy())
+    # With projectors and sparse matrices
+    modes3 = kwant.physics.leads.modes(sparse.csr_matrix(H_cell),
+                                       sparse.coo_matrix(H_hop),
+                                       projectors=projectors)
+    current_conserving(modes3[1])
+    assert_almost_equal(modes1[1].selfenergy(), modes3[1].selfenergy())
 
 def check_bdiag_modes(modes, block_rows, block_cols):
     for vs in modes:
@@ -149,8 +149,13 @@ def test_projectors_and_symmetry():
 
 def test_validate():
     csr = sparse.csr_matrix
+    sym = DiscreteSymmetry()
+    assert sym.is_trivial()
+    assert sym.validate(np.array([[1, 1j], [0, 2]])) == []
+
     sym = DiscreteSymmetry(projectors=[csr(np.array([[1], [0]])),
                                        csr(np.array([[0], [1]]))])
+    assert not sym.is_trivial()
     assert sym.validate(csr(np.array([[0], [1]]))) == ['Conservation law']
     assert sym.validate(np.array([[1], [0]])) == []
     assert sym.validate(np.eye(2)) == []
@@ -167,6 +172,14 @@ def test_validate():
     sym = DiscreteSymmetry(chiral=csr(np.diag((1, -1))))
     assert sym.validate(np.eye(2)) == ['Chiral']
     assert sym.validate(1 - np.eye(2)) == []
+    assert sym.validate_pair(1 - np.eye(2), np.eye(2)) == ['Chiral']
+    assert sym.validate_pair(1 - np.eye(2), csr(1 - np.eye(2))) == []
+
+    sym = DiscreteSymmetry(projectors=[csr(np.array([[1], [0]])),
+                                       csr(np.array([[0], [1]]))],
+                           chiral=csr(np.diag((1, -1))))
+    assert (sym.validate_pair(np.eye(2), np.array([[0], [1]]))
+            == ['Conservation law', 'Chiral'])
 
 
 def random_onsite_hop(n, rng=0):
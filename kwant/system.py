@@ -18,13 +18,13 @@ __all__ = [
 import abc
 import warnings
 import operator
-from copy import copy
 import collections
-from functools import total_ordering, lru_cache
+from functools import lru_cache
 import numpy as np
+import scipy.sparse as sp
 import tinyarray as ta
 from . import _system
-from ._common  import deprecate_args, KwantDeprecationWarning
+from ._common  import deprecate_args, KwantDeprecationWarning, cached_property
 
 
 
@@ -60,6 +60,13 @@ class Site(tuple):
     variables under the same names.  Given a site ``site``, common things to
     query are thus ``site.family``, ``site.tag``, and ``site.pos``.
     """
+    # Sites are kept as plain tuples without any per-instance storage: this
+    # way hashing and equality testing (which the builder does all the time)
+    # are done by the C implementation of tuple.  The hash of the family is
+    # precomputed (see `SiteFamily.__init__`), so hashing a site essentially
+    # amounts to hashing its tag.  Caching the hash in an extra attribute
+    # would require Python-level '__hash__' and '__eq__' methods, which makes
+    # dictionary lookups slower rather than faster.
     __slots__ = ()
 
     family = property(operator.itemgetter(0),
@@ -68,6 +75,8 @@ class Site(tuple):
 
 
     def __new__(cls, family, tag, _i_know_what_i_do=False):
+        # '_i_know_what_i_do' is only kept for unpickling (see
+        # '__getnewargs__').  Internal code should use '_make' instead.
         if _i_know_what_i_do:
             return tuple.__new__(cls, (family, tag))
         try:
@@ -77,6 +86,14 @@ class Site(tuple):
             raise type(e)(msg.format(repr(tag), repr(family), e.args[0]))
         return tuple.__new__(cls, (family, tag))
 
+    @classmethod
+    def _make(cls, family, tag):
+        """Create a site without normalizing ``tag``.
+
+        ``tag`` must already be in the normalized form for ``family``.
+        """
+        return tuple.__new__(cls, (family, tag))
+
     def __repr__(self):
         return 'Site({0}, {1})'.format(repr(self.family), repr(self.tag))
 
@@ -126,6 +143,19 @@ class SiteArray(collections.abc.Sequence):
             raise type(e)(msg.format(repr(tags), repr(family), e.args[0]))
         self.tags = tags
 
+    @classmethod
+    def from_validated(cls, family, tags):
+        """Create a site array without normalizing ``tags``.
+
+        ``tags`` must already be in the normalized form for ``family``,
+        e.g. because they were obtained from the tags of another site array
+        of the same family.
+        """
+        site_array = cls.__new__(cls)
+        site_array.family = family
+        site_array.tags = tags
+        return site_array
+
     def __repr__(self):
         return 'SiteArray({0}, {1})'.format(repr(self.family), repr(self.tags))
 
@@ -139,14 +169,15 @@ class SiteArray(collections.abc.Sequence):
 
     def __getitem__(self, key):
         if isinstance(key, slice):
-            return SiteArray(self.family, self.tags[key])
+            return SiteArray.from_validated(self.family, self.tags[key])
         else:
             return Site(self.family, self.tags[key])
 
     def __eq__(self, other):
         if not isinstance(other, SiteArray):
             raise NotImplementedError()
-        return self.family == other.family and np.all(self.tags == other.tags)
+        return (self.family == other.family
+                and np.array_equal(self.tags, other.tags))
 
     def positions(self):
         """Real space position of the site.
@@ -156,7 +187,6 @@ class SiteArray(collections.abc.Sequence):
         return self.family.positions(self.tags)
 
 
-@total_ordering
 class SiteFamily:
     """Abstract base class for site families.
 
@@ -177,7 +207,11 @@ class SiteFamily:
 
     All site families must define either 'normalize_tag' or 'normalize_tags',
     which brings a tag (or, in the latter case, a sequence of tags) to the
-    standard format for this site family.
+    standard format for this site family.  Site families whose tags are
+    vectors of numbers may additionally set the class attribute
+    ``tag_dtype``; the default ``normalize_tags`` then converts a whole
+    sequence of tags to a 2D array of that dtype in one go, instead of
+    normalizing each tag separately.
 
     Site families may also implement methods ``pos(tag)`` and
     ``positions(tags)``, which return a vector of realspace coordinates or an
@@ -197,6 +231,8 @@ class SiteFamily:
     be raised.
     """
 
+    tag_dtype = None
+
     def __init__(self, canonical_repr, name, norbs):
         self.canonical_repr = canonical_repr
         self.hash = hash(canonical_repr)
@@ -244,11 +280,21 @@ class SiteFamily:
         except AttributeError:
             return True
 
+    # If the following raise an AttributeError, we were trying
+    # to compare to something non-comparable anyway.
+
     def __lt__(self, other):
-        # If this raises an AttributeError, we were trying
-        # to compare it to something non-comparable anyway.
         return self.canonical_repr < other.canonical_repr
 
+    def __le__(self, other):
+        return self.canonical_repr <= other.canonical_repr
+
+    def __gt__(self, other):
+        return self.canonical_repr > other.canonical_repr
+
+    def __ge__(self, other):
+        return self.canonical_repr >= other.canonical_repr
+
     def normalize_tag(self, tag):
         """Return a normalized version of the tag.
 
@@ -262,7 +308,13 @@ class SiteFamily:
 
         Raises TypeError or ValueError if the tags are not acceptable.
         """
-        return np.array([self.normalize_tag(tag) for tag in tags])
+        if self.tag_dtype is None:
+            return np.array([self.normalize_tag(tag) for tag in tags])
+        tags = np.asarray(tags, self.tag_dtype)
+        if tags.ndim != 2:
+            raise ValueError("Expecting a sequence of tags of equal length.")
+        tags.flags.writeable = False
+        return tags
 
     def __call__(self, *tag):
         """
@@ -329,7 +381,9 @@ class Symmetry(metaclass=abc.ABCMeta):
             A single tuple if ``site`` is a Site, or a sequence of tuples if
             ``site`` is a SiteArray.  The group element(s) whose action
             on a certain site(s) from the fundamental domain will result
-            in the given ``site``.
+            in the given ``site``.  In the latter case the group elements
+            are stored as the columns of an array of shape
+            ``(num_directions, len(site))``.
         """
         pass
 
@@ -364,7 +418,18 @@ class Symmetry(metaclass=abc.ABCMeta):
 
         Equivalent to `self.act(-self.which(a), a, b)`.
         """
-        return self.act(-self.which(a), a, b)
+        element = self.which(a)
+        # Sites that are already in the fundamental domain need not be
+        # acted upon.  If 'b' belongs to another family we still go through
+        # 'act', as that checks that the family is compatible with 'self'.
+        if b is None or b.family == a.family:
+            if isinstance(a, Site):
+                in_fd = not any(element)
+            else:
+                in_fd = not np.any(element)
+            if in_fd:
+                return a if b is None else (a, b)
+        return self.act(-element, a, b)
 
     def in_fd(self, site):
         """Tell whether ``site`` lies within the fundamental domain.
@@ -387,8 +452,10 @@ class Symmetry(metaclass=abc.ABCMeta):
                     return False
             return True
         elif isinstance(site, SiteArray):
-            which = self.which(site)
-            return np.logical_and.reduce(which != 0, axis=1)
+            # 'which' has one row per symmetry direction and one column
+            # per site; a site is in the fundamental domain if and only if
+            # all the components of its group element vanish.
+            return ~np.any(self.which(site), axis=0)
         else:
             raise TypeError("'site' must be a Site or SiteArray")
 
@@ -409,6 +476,18 @@ class Symmetry(metaclass=abc.ABCMeta):
         pass
 
 
+@lru_cache(maxsize=16)
+def _empty_group_elements(num_sites):
+    """Return the group elements of the trivial group for 'num_sites' sites.
+
+    The returned array has the shape ``(0, num_sites)`` expected from
+    `Symmetry.which` for site arrays, and is read-only as it is shared.
+    """
+    elements = np.empty((0, num_sites), dtype=int)
+    elements.flags.writeable = False
+    return elements
+
+
 class NoSymmetry(Symmetry):
     """A symmetry with a trivial symmetry group."""
 
@@ -430,10 +509,12 @@ class NoSymmetry(Symmetry):
     _empty_array = ta.array((), int)
 
     def which(self, site):
+        if isinstance(site, SiteArray):
+            return _empty_group_elements(len(site))
         return self._empty_array
 
     def act(self, element, a, b=None):
-        if element:
+        if len(element):
             raise ValueError('`element` must be empty for NoSymmetry.')
         return a if b is None else (a, b)
 
@@ -441,6 +522,8 @@ class NoSymmetry(Symmetry):
         return a if b is None else (a, b)
 
     def in_fd(self, site):
+        if isinstance(site, SiteArray):
+            return np.ones(len(site), dtype=bool)
         return True
 
     def subgroup(self, *generators):
@@ -455,6 +538,21 @@ class NoSymmetry(Symmetry):
 ################ Systems
 
 
+_physics_module = None
+
+
+def _physics():
+    """Return the 'kwant.physics' module.
+
+    It cannot be imported at module level, because it imports this module.
+    """
+    global _physics_module
+    if _physics_module is None:
+        from . import physics
+        _physics_module = physics
+    return _physics_module
+
+
 class System(metaclass=abc.ABCMeta):
     """Abstract general low-level system.
 
@@ -470,6 +568,12 @@ class System(metaclass=abc.ABCMeta):
         range.  In addition, the final triple should have the form
         ``(graph.num_nodes, 0, tot_norbs)`` where ``tot_norbs`` is the
         total number of orbitals in the system.
+    orbital_offsets : None or 1D integer array
+        ``None`` if ``site_ranges`` is ``None``.  Otherwise the offset of the
+        first orbital of every site, computed from ``site_ranges``.  Has
+        ``graph.num_nodes + 1`` entries, the last one being the total number
+        of orbitals, such that the orbitals of site ``i`` are
+        ``range(orbital_offsets[i], orbital_offsets[i + 1])``.
     parameters : frozenset of strings
         The names of the parameters on which the system depends. This attribute
         is provisional and may be changed in a future version of Kwant
@@ -516,22 +620,32 @@ class System(metaclass=abc.ABCMeta):
         Providing positional arguments via 'args' is deprecated,
         instead, provide named parameters as a dictionary via 'params'.
         """
-        # Avoid the circular import.
-        from .physics import DiscreteSymmetry
-        return DiscreteSymmetry()
+        return _physics().DiscreteSymmetry()
 
+    @property
+    def orbital_offsets(self):
+        """The offset of the first orbital of every site, or None."""
+        # Not cached: it is cheap to compute and would otherwise end up in
+        # pickles of the system.
+        if self.site_ranges is None:
+            return None
+        first_sites, norbs, orb_offsets = np.transpose(self.site_ranges)
+        orbital_offsets = np.empty(first_sites[-1] + 1, dtype=int)
+        orbital_offsets[0] = orb_offsets[0]
+        np.cumsum(np.repeat(norbs[:-1], np.diff(first_sites)),
+                  out=orbital_offsets[1:])
+        orbital_offsets[1:] += orb_offsets[0]
+        return orbital_offsets
 
     def __str__(self):
-        items = [
-            # (format, extractor, skip if info not present)
-            ('{} sites', self.graph.num_nodes, False),
-            ('{} hoppings', self.graph.num_edges, False),
-            ('parameters: {}', tuple(self.parameters), True),
-        ]
-        # Skip some information when it's not present (parameters)
-        details = [fmt.format(info) for fmt, info, skip in items
-                   if (info or not skip)]
-        details = ', and '.join((', '.join(details[:-1]), details[-1]))
+        details = ['{} sites'.format(self.graph.num_nodes),
+                   '{} hoppings'.format(self.graph.num_edges)]
+        # Skip the parameters when there are none (or they are unknown).
+        # They are sorted so that the output does not depend on hashing.
+        if self.parameters:
+            parameters = tuple(sorted(self.parameters))
+            details.append('parameters: {}'.format(parameters))
+        details = ', '.join(details[:-1]) + ', and ' + details[-1]
         return '<{} with {}>'.format(self.__class__.__name__, details)
 
     hamiltonian_submatrix = _system.hamiltonian_submatrix
@@ -615,20 +729,24 @@ class VectorizedSystem(System, metaclass=abc.ABCMeta):
             elements in this term (or the number selected by 'selector'
             if provided), ``P`` and ``Q`` are the number of orbitals in the
             'to' and 'from' site arrays associated with this term.
+            This may be a read-only view (for example when all elements of
+            the term are equal) and must not be modified.
 
         Providing positional arguments via 'args' is deprecated,
         instead, provide named parameters as a dictionary via 'params'.
         """
 
-    @property
-    @lru_cache(1)
+    @cached_property
     def site_ranges(self):
-        site_offsets = np.cumsum([0] + [len(arr) for arr in self.site_arrays])
-        norbs = [arr.family.norbs for arr in self.site_arrays] + [0]
-        orb_offsets = np.cumsum(
-            [0] + [len(arr) * arr.family.norbs for arr in self.site_arrays]
-        )
-        return np.array([site_offsets, norbs, orb_offsets]).transpose()
+        site_ranges = np.zeros((len(self.site_arrays) + 1, 3), dtype=int)
+        site_offset = orb_offset = 0
+        for i, arr in enumerate(self.site_arrays):
+            norbs = arr.family.norbs
+            site_ranges[i] = site_offset, norbs, orb_offset
+            site_offset += len(arr)
+            orb_offset += len(arr) * norbs
+        site_ranges[-1] = site_offset, 0, orb_offset
+        return site_ranges
 
     hamiltonian_submatrix = _system.vectorized_hamiltonian_submatrix
 
@@ -720,24 +838,36 @@ class FiniteSystemMixin(metaclass=abc.ABCMeta):
             raise ValueError("Invalid value of argument 'what': "
                              "{0}".format(what))
 
-        result = copy(self)
+        want_modes = what in ('modes', 'all')
+        want_selfenergy = what in ('selfenergy', 'all')
         if leads is None:
-            leads = list(range(len(self.leads)))
+            leads = range(len(self.leads))
+        else:
+            leads = set(leads)
         new_leads = []
         for nr, lead in enumerate(self.leads):
             if nr not in leads:
                 new_leads.append(lead)
                 continue
             modes, selfenergy = None, None
-            if what in ('modes', 'all'):
+            if want_modes:
                 modes = lead.modes(energy, args, params=params)
-            if what in ('selfenergy', 'all'):
+            if want_selfenergy:
                 if modes:
                     selfenergy = modes[1].selfenergy()
                 else:
                     selfenergy = lead.selfenergy(energy, args, params=params)
             new_leads.append(PrecalculatedLead(modes, selfenergy))
-        result.leads = new_leads
+        return self._with_leads(new_leads)
+
+    def _with_leads(self, leads):
+        """Return a shallow copy of the system with different leads.
+
+        All other attributes are shared with ``self``.
+        """
+        result = object.__new__(type(self))
+        result.__dict__ = self.__dict__.copy()
+        result.leads = leads
         return result
 
     @deprecate_args
@@ -752,6 +882,8 @@ class FiniteSystemMixin(metaclass=abc.ABCMeta):
         instead, provide named parameters as a dictionary via 'params'.
         """
         symmetries = self.discrete_symmetry(args=args, params=params)
+        if symmetries.is_trivial():
+            return []
         ham = self.hamiltonian_submatrix(args, sparse=True, params=params)
         return symmetries.validate(ham)
 
@@ -769,8 +901,47 @@ def is_finite(syst):
     return isinstance(syst, (FiniteSystem, FiniteVectorizedSystem))
 
 
+_symmetry_attribute_names = {'Conservation law': 'projectors',
+                             'Time reversal': 'time_reversal',
+                             'Particle-hole': 'particle_hole',
+                             'Chiral': 'chiral'}
+
+
+def _subtract_from_diagonal(matrix, value):
+    """Subtract 'value' from the diagonal of the square array 'matrix'."""
+    n = matrix.shape[0]
+    if matrix.flags.c_contiguous:
+        # A strided view of a C-contiguous array is its diagonal.  Updating
+        # it in place is faster than going through 'matrix.flat'.
+        diagonal = matrix.reshape(-1)[::n + 1]
+        diagonal -= value
+    else:
+        matrix.flat[::n + 1] -= value
+
+
 class InfiniteSystemMixin(metaclass=abc.ABCMeta):
 
+    def _prefer_sparse_cell(self):
+        """Whether the cell matrices are better stored as sparse matrices.
+
+        Used for 'sparse=None' in 'cell_hamiltonian' and 'inter_cell_hopping':
+        large cells with few non-zero blocks per site are stored as sparse
+        matrices.  The number of edges of the graph bounds the number of
+        non-zero off-diagonal blocks.
+        """
+        n = self.cell_size
+        return n > 128 and n + self.graph.num_edges < 0.05 * n * n
+
+    def _cell_matrices(self, args, params, sparse=False):
+        """Return the cell Hamiltonian and the inter-cell hopping."""
+        ham = self.cell_hamiltonian(args, sparse=sparse, params=params)
+        hop = self.inter_cell_hopping(args, sparse=sparse, params=params)
+        shape = ham.shape
+        if len(shape) != 2 or shape[0] != shape[1]:
+            raise ValueError('The cell Hamiltonian must be a square '
+                             'matrix, but has shape {}.'.format(shape))
+        return ham, hop
+
     @deprecate_args
     def modes(self, energy=0, args=(), *, params=None):
         """Return mode decomposition of the lead
@@ -794,33 +965,32 @@ class InfiniteSystemMixin(metaclass=abc.ABCMeta):
         Providing positional arguments via 'args' is deprecated,
         instead, provide named parameters as a dictionary via 'params'.
         """
-        from . import physics   # Putting this here avoids a circular import.
-        ham = self.cell_hamiltonian(args, params=params)
-        hop = self.inter_cell_hopping(args, params=params)
         symmetries = self.discrete_symmetry(args, params=params)
+        # With a conservation law, 'physics.modes' only needs dense copies
+        # of the blocks selected by the projectors.  For small cells, the
+        # dense matrices are faster nevertheless.
+        sparse = (symmetries.projectors is not None
+                  and self._prefer_sparse_cell())
+        ham, hop = self._cell_matrices(args, params, sparse)
         # Check whether each symmetry is broken.
         # If a symmetry is broken, it is ignored in the computation.
-        broken = set(symmetries.validate(ham) + symmetries.validate(hop))
-        attribute_names = {'Conservation law': 'projectors',
-                          'Time reversal': 'time_reversal',
-                          'Particle-hole': 'particle-hole',
-                          'Chiral': 'chiral'}
-        for name in broken:
+        for name in symmetries.validate_pair(ham, hop):
             warnings.warn('Hamiltonian breaks ' + name +
                           ', ignoring the symmetry in the computation.')
-            assert name in attribute_names, 'Inconsistent naming of symmetries'
-            setattr(symmetries, attribute_names[name], None)
+            assert name in _symmetry_attribute_names, \
+                'Inconsistent naming of symmetries'
+            setattr(symmetries, _symmetry_attribute_names[name], None)
 
-        shape = ham.shape
-        assert len(shape) == 2
-        assert shape[0] == shape[1]
         # Subtract energy from the diagonal.
-        ham.flat[::ham.shape[0] + 1] -= energy
+        if energy and sparse:
+            ham = ham - energy * sp.identity(ham.shape[0], format='csr')
+        elif energy:
+            _subtract_from_diagonal(ham, energy)
 
         # Particle-hole and chiral symmetries only apply at zero energy.
         if energy:
             symmetries.particle_hole = symmetries.chiral = None
-        return physics.modes(ham, hop, discrete_symmetry=symmetries)
+        return _physics().modes(ham, hop, discrete_symmetry=symmetries)
 
     @deprecate_args
     def selfenergy(self, energy=0, args=(), *, params=None):
@@ -833,15 +1003,11 @@ class InfiniteSystemMixin(metaclass=abc.ABCMeta):
         Providing positional arguments via 'args' is deprecated,
         instead, provide named parameters as a dictionary via 'params'.
         """
-        from . import physics   # Putting this here avoids a circular import.
-        ham = self.cell_hamiltonian(args, params=params)
-        shape = ham.shape
-        assert len(shape) == 2
-        assert shape[0] == shape[1]
+        ham, hop = self._cell_matrices(args, params)
         # Subtract energy from the diagonal.
-        ham.flat[::ham.shape[0] + 1] -= energy
-        return physics.selfenergy(ham,
-                                  self.inter_cell_hopping(args, params=params))
+        if energy:
+            _subtract_from_diagonal(ham, energy)
+        return _physics().selfenergy(ham, hop)
 
     @deprecate_args
     def validate_symmetries(self, args=(), *, params=None):
@@ -855,10 +1021,11 @@ class InfiniteSystemMixin(metaclass=abc.ABCMeta):
         instead, provide named parameters as a dictionary via 'params'.
         """
         symmetries = self.discrete_symmetry(args=args, params=params)
+        if symmetries.is_trivial():
+            return []
         ham = self.cell_hamiltonian(args=args, sparse=True, params=params)
         hop = self.inter_cell_hopping(args=args, sparse=True, params=params)
-        broken = set(symmetries.validate(ham) + symmetries.validate(hop))
-        return list(broken)
+        return symmetries.validate_pair(ham, hop)
 
 
 class InfiniteSystem(System, InfiniteSystemMixin, metaclass=abc.ABCMeta):
@@ -907,9 +1074,14 @@ class InfiniteSystem(System, InfiniteSystemMixin, metaclass=abc.ABCMeta):
     def cell_hamiltonian(self, args=(), sparse=False, *, params=None):
         """Hamiltonian of a single cell of the infinite system.
 
+        If 'sparse' is None, a sparse matrix is returned for large and
+        sparsely connected cells, and a dense array otherwise.
+
         Providing positional arguments via 'args' is deprecated,
         instead, provide named parameters as a dictionary via 'params'.
         """
+        if sparse is None:
+            sparse = self._prefer_sparse_cell()
         cell_sites = range(self.cell_size)
         return self.hamiltonian_submatrix(args, cell_sites, cell_sites,
                                           sparse=sparse, params=params)
@@ -918,9 +1090,14 @@ class InfiniteSystem(System, InfiniteSystemMixin, metaclass=abc.ABCMeta):
     def inter_cell_hopping(self, args=(), sparse=False, *, params=None):
         """Hopping Hamiltonian between two cells of the infinite system.
 
+        If 'sparse' is None, a sparse matrix is returned for large and
+        sparsely connected cells, and a dense array otherwise.
+
         Providing positional arguments via 'args' is deprecated,
         instead, provide named parameters as a dictionary via 'params'.
         """
+        if sparse is None:
+            sparse = self._prefer_sparse_cell()
         cell_sites = range(self.cell_size)
         interface_sites = range(self.cell_size, self.graph.num_nodes)
         return self.hamiltonian_submatrix(args, cell_sites, interface_sites,
@@ -992,6 +1169,11 @@ def _normalize_matrix_blocks(blocks, expected_shape, *, calling_function=None):
     calling_function : callable (optional)
         The function that produced 'blocks'. If provided, used to give
         a more helpful error message if 'blocks' is not of the correct shape.
+
+    Notes
+    -----
+    A single scalar or matrix is broadcast without being copied, so the
+    returned array may be a read-only view.
     """
     try:
         blocks = np.asarray(blocks, dtype=complex)
@@ -1002,11 +1184,11 @@ def _normalize_matrix_blocks(blocks, expected_shape, *, calling_function=None):
     original_shape = blocks.shape
     was_broadcast = True  # Did the shape get broadcasted to a more general one?
     if len(blocks.shape) == 0:  # scalar → broadcast to vector of 1x1 matrices
-        blocks = np.tile(blocks, (expected_shape[0], 1, 1))
+        blocks = np.broadcast_to(blocks, (expected_shape[0], 1, 1))
     elif len(blocks.shape) == 1:  # vector → interpret as vector of 1x1 matrices
         blocks = blocks.reshape(-1, 1, 1)
     elif len(blocks.shape) == 2:  # matrix → broadcast to vector of matrices
-        blocks = np.tile(blocks, (expected_shape[0], 1, 1))
+        blocks = np.broadcast_to(blocks, (expected_shape[0],) + blocks.shape)
     else:
         was_broadcast = False
 
@@ -1039,16 +1221,26 @@ class PrecalculatedLead:
         Notes
         -----
         At least one of ``modes`` and ``selfenergy`` must be provided.
+
+        The self-energy is stored as a read-only, C-contiguous complex
+        array, such that the solvers do not need to convert it each time
+        it is used.  The modes are stored as given.
         """
         if modes is None and selfenergy is None:
             raise ValueError("No precalculated values provided.")
+        if selfenergy is not None:
+            # A view, such that the flags of the caller's array are kept.
+            selfenergy = np.ascontiguousarray(selfenergy, dtype=complex).view()
+            selfenergy.flags.writeable = False
         self._modes = modes
         self._selfenergy = selfenergy
         # Modes/Self-energy have already been evaluated, so there
         # is no parametric dependence anymore
         self.parameters = frozenset()
 
-    @deprecate_args
+    # 'modes' and 'selfenergy' ignore their arguments, so they are not
+    # wrapped with 'deprecate_args': the solvers call them once per lead and
+    # energy, and there is no use in checking 'args' here.
     def modes(self, energy=0, args=(), *, params=None):
         if self._modes is not None:
             return self._modes
@@ -1057,7 +1249,6 @@ class PrecalculatedLead:
                              "Consider using precalculate() with "
                              "what='modes' or what='all'")
 
-    @deprecate_args
     def selfenergy(self, energy=0, args=(), *, params=None):
         if self._selfenergy is not None:
             return self._selfenergy
@@ -784,6 +784,17 @@ def test_vectorized_hamiltonian_evaluation():
         fsyst_simple.inter_cell_hopping(),
     )
 
+    # Systems that cannot be cached on are still evaluated correctly.
+    class Unhashable(type(fsyst_vectorized)):
+        __hash__ = None
+
+    expected = fsyst_vectorized.cell_hamiltonian(sparse=True).toarray()
+    fsyst_vectorized.__class__ = Unhashable
+    for _ in range(2):
+        assert np.allclose(
+            fsyst_vectorized.cell_hamiltonian(sparse=True).toarray(),
+            expected)
+
 
 def test_vectorized_value_normalization():
     # Here we test whether all legal shapes for values for vectorized Builders
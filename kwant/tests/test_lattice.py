@@ -333,3 +333,24 @@ def test_act_sites_array():
                          for sa in [new_site_array]}
         for name in trans_tags_dict:
             assert np.all(trans_tags_dict[name] == new_tags_dict[name])
+
+
+def test_in_fd_sites_array():
+    lat = lattice.square(norbs=1)
+
+    tags = [(i, j) for i in range(-3, 4) for j in range(3)]
+    sites = [lat(*tag) for tag in tags]
+    site_array = builder.SiteArray(lat, tags=tags)
+
+    for vectors in ([(2, 0)], [(2, 0), (0, 2)]):
+        symm = lattice.TranslationalSymmetry(*vectors)
+        expected = [symm.in_fd(site) for site in sites]
+        assert np.array_equal(symm.in_fd(site_array), expected)
+
+    ns = system.NoSymmetry()
+    in_fd = ns.in_fd(site_array)
+    assert in_fd.shape == (len(site_array),)
+    assert np.all(in_fd)
+    which = ns.which(site_array)
+    assert which.shape == (0, len(site_array))
+    assert ns.act(which, site_array) is site_array
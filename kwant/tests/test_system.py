@@ -7,6 +7,7 @@
 # https://kwant-project.org/authors.
 
 import pickle
+import warnings
 import copy
 import pytest
 from pytest import raises
@@ -74,6 +75,13 @@ def test_hamiltonian_submatrix(vectorize):
     np.testing.assert_almost_equal(smatrix, smatrix2)
     raises(ValueError, kwant.solvers.default.greens_function, syst3, 0.2)
 
+    selfenergy = np.asfortranarray(rng.randn(2, 2))
+    lead = kwant.system.PrecalculatedLead(selfenergy=selfenergy)
+    stored = lead.selfenergy()
+    assert stored.dtype == complex and stored.flags.c_contiguous
+    assert not stored.flags.writeable and selfenergy.flags.writeable
+    np.testing.assert_array_equal(stored, selfenergy)
+
     # Test for shape errors.
     badly_shaped_hoppings = [
         1,
@@ -109,3 +117,116 @@ def test_pickling(vectorize):
     s = kwant.smatrix(syst, 0.1)
     for other in (syst_copy1, syst_copy2, syst_copy3, syst_copy4):
         assert np.all(kwant.smatrix(other, 0.1).data == s.data)
+
+
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_orbital_offsets(vectorize):
+    syst = kwant.Builder(vectorize=vectorize)
+    chain = kwant.lattice.chain(norbs=1)
+    chain3 = kwant.lattice.chain(norbs=3, name='3')
+    for i in range(3):
+        syst[chain(i)] = 0
+        syst[chain3(i)] = np.zeros((3, 3))
+    syst = syst.finalized()
+
+    offsets = syst.orbital_offsets
+    assert len(offsets) == syst.graph.num_nodes + 1
+    assert offsets[-1] == syst.hamiltonian_submatrix().shape[0]
+    for i, site in enumerate(syst.sites):
+        assert offsets[i + 1] - offsets[i] == site.family.norbs
+
+
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_lead_global_state(vectorize):
+    # Value functions may read global state, so nothing that depends on
+    # them may be reused between calls, even for equal parameters.
+    potential = [0]
+    lat = kwant.lattice.chain(norbs=1)
+    lead = kwant.Builder(kwant.TranslationalSymmetry([-1]),
+                         vectorize=vectorize)
+    lead[lat(0)] = lambda site, t: potential[0]
+    lead[lat(1), lat(0)] = lambda site1, site2, t: -t
+    lead = lead.finalized()
+
+    calls = []
+    cell_hamiltonian = lead.cell_hamiltonian
+    def counting_cell_hamiltonian(*args, **kwargs):
+        calls.append(None)
+        return cell_hamiltonian(*args, **kwargs)
+    lead.cell_hamiltonian = counting_cell_hamiltonian
+
+    params = dict(t=1.0)
+    first = lead.selfenergy(0.5, params=params)
+    assert lead.modes(0.5, params=params)[0].velocities.size == 2
+    assert len(calls) == 2
+
+    potential[0] = 3
+    assert lead.selfenergy(0.5, params=params) != pytest.approx(first)
+    assert lead.modes(0.5, params=params)[0].velocities.size == 0
+    assert len(calls) == 4
+
+
+def test_modes_broken_particle_hole():
+    # A declared particle-hole symmetry that is broken by the Hamiltonian is
+    # ignored, with a warning.
+    lat = kwant.lattice.chain(norbs=2)
+    sx = np.array([[0, 1], [1, 0]])
+    leads = []
+    for particle_hole in (sx, None):
+        lead = kwant.Builder(kwant.TranslationalSymmetry((-1,)),
+                             particle_hole=particle_hole)
+        lead[lat(0)] = np.diag([0.5, 1])
+        lead[lat(1), lat(0)] = -np.eye(2)
+        leads.append(lead.finalized())
+
+    with pytest.warns(UserWarning, match='Particle-hole'):
+        prop, stab = leads[0].modes(0)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        prop_ref, stab_ref = leads[1].modes(0)
+    # The particle-hole symmetry, if used, would fix the basis of the modes.
+    np.testing.assert_allclose(prop.wave_functions, prop_ref.wave_functions)
+    np.testing.assert_allclose(prop.momenta, prop_ref.momenta)
+    np.testing.assert_allclose(stab.vecs, stab_ref.vecs)
+
+
+def test_modes_sparse_conservation_law():
+    # Leads with a conservation law may use sparse cell matrices in 'modes';
+    # the result must be the same as with dense ones.
+    lat = kwant.lattice.square(norbs=2)
+    sz = np.diag([1, -1])
+    lead = kwant.Builder(kwant.TranslationalSymmetry((-1, 0)),
+                         conservation_law=-sz)
+    lead[(lat(0, y) for y in range(4))] = 4 * np.eye(2) + 0.3 * sz
+    lead[lat.neighbors()] = -np.eye(2)
+    lead = lead.finalized()
+
+    results = []
+    for prefer_sparse in (False, True):
+        lead._prefer_sparse_cell = lambda: prefer_sparse
+        results.append(lead.modes(1.1))
+    (prop, stab), (prop_sparse, stab_sparse) = results
+    np.testing.assert_allclose(np.sort(prop.momenta),
+                               np.sort(prop_sparse.momenta))
+    np.testing.assert_allclose(np.sort(prop.velocities),
+                               np.sort(prop_sparse.velocities))
+    np.testing.assert_allclose(stab.selfenergy(), stab_sparse.selfenergy(),
+                               atol=1e-12)
+
+
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_cell_hamiltonian_auto_sparse(vectorize):
+    lat = kwant.lattice.square(norbs=1)
+    for width, is_sparse in [(10, False), (200, True)]:
+        lead = kwant.Builder(kwant.TranslationalSymmetry((-1, 0)),
+                             vectorize=vectorize)
+        lead[(lat(0, y) for y in range(width))] = 4
+        lead[lat.neighbors()] = -1
+        lead = lead.finalized()
+        ham = lead.cell_hamiltonian(sparse=None)
+        hop = lead.inter_cell_hopping(sparse=None)
+        assert sparse.issparse(ham) == sparse.issparse(hop) == is_sparse
+        assert np.allclose(sparse.csr_matrix(ham).toarray(),
+                           lead.cell_hamiltonian())
+        assert np.allclose(sparse.csr_matrix(hop).toarray(),
+                           lead.inter_cell_hopping())